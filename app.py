@@ -1,248 +1,312 @@
 import streamlit as st
-import pdfplumber
 import pandas as pd
+import numpy as np
 import os
-import re
-import plotly.express as px
+import json
+import hashlib
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import plotly.graph_objects as go
+from extraction import FIELD_ANCHORS, PAGE_LIMIT, POLICIES, POLICY_WINDOW, process_one_pdf
+
+# Optional: Numba JIT-compiles the per-row scoring kernel for large corpora. Not in requirements.txt:
+# it's a heavy LLVM dependency that only pays off from NUMBA_MIN_ROWS companies, far beyond the bundled reports
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+SCORE_COLUMNS = ["Risk Score", "Talk Score", "Walk Score"]
+NUMBA_MIN_ROWS = 1000 # below this, JIT warm-up costs more than the vectorized pandas path
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _score_kernel(renew, total, csr, policies, n_policies, out_talk, out_walk, out_risk):
+        # Same formulas as the pandas path in _score, one row per iteration
+        for i in prange(renew.size):
+            talk = policies[i] / n_policies * 100
+            renew_mix = renew[i] / total[i] * 100 if total[i] > 10 else 0.0
+            walk = renew_mix + min(csr[i] / 500 * 50, 50.0)
+            if walk > 100:
+                walk = 100.0
+            out_talk[i] = talk
+            out_walk[i] = walk
+            out_risk[i] = max(talk - walk, 0.0)
+
+def _score(df):
+    """Add the Talk/Walk/Risk score columns, vectorized across every company."""
+    if njit is not None and len(df) >= NUMBA_MIN_ROWS:
+        n = len(df)
+        talk, walk, risk = np.empty(n), np.empty(n), np.empty(n)
+        _score_kernel(
+            np.ascontiguousarray(df['Renewable Energy'], dtype=np.float64),
+            np.ascontiguousarray(df['Total Energy'], dtype=np.float64),
+            np.ascontiguousarray(df['CSR Spend (Cr)'], dtype=np.float64),
+            np.ascontiguousarray(df['Policies'], dtype=np.float64),
+            float(len(POLICIES)), talk, walk, risk,
+        )
+        talk, walk, risk = (pd.Series(a, index=df.index) for a in (talk, walk, risk))
+    else:
+        # Scoring Logic
+        talk = df['Policies'] / len(POLICIES) * 100
+        
+        # Walk Score Logic (Simplified for Demo)
+        renew_mix = (df['Renewable Energy'] / df['Total Energy'] * 100).where(df['Total Energy'] > 10, 0)
+        csr_score = (df['CSR Spend (Cr)'] / 500 * 50).clip(upper=50) # Cap at 50 points
+        walk = (renew_mix + csr_score).clip(upper=100)
+        
+        risk = (talk - walk).clip(lower=0)
+    
+    df["Risk Score"] = risk.round(1)
+    df["Talk Score"] = talk.round(1)
+    df["Walk Score"] = walk.round(1)
+    # Keep the scores next to the company name, as in the exported report
+    return df[["Company"] + SCORE_COLUMNS + [c for c in df.columns if c not in SCORE_COLUMNS and c != "Company"]]
+
+# --- ON-DISK CACHE ---
+# Raw extracted rows (indexed by filename) plus a manifest of each PDF's (mtime, size), so restarts skip re-parsing
+CACHE_FILE = ".audit_cache.parquet"
+MANIFEST_FILE = ".audit_cache.json"
+CACHE_VERSION = 2 # bump whenever extraction logic changes in a way the settings below don't capture
+# Cached rows are only valid for the extraction that produced them; any mismatch is a full miss
+CACHE_KEY = hashlib.sha1(json.dumps(
+    [CACHE_VERSION, FIELD_ANCHORS, POLICIES, POLICY_WINDOW, PAGE_LIMIT]).encode()).hexdigest()
+
+def _load_cache(folder_path):
+    """Return (manifest, raw rows) from a previous run, or ({}, None) if there is no usable cache."""
+    try:
+        with open(os.path.join(folder_path, MANIFEST_FILE)) as f:
+            stored = json.load(f)
+        raw = pd.read_parquet(os.path.join(folder_path, CACHE_FILE))
+        # Reject caches from other builds, and a parquet/manifest pair written by different sessions
+        if stored["key"] != CACHE_KEY or sorted(raw.index) != stored["rows"]:
+            return {}, None
+        return stored["files"], raw
+    except Exception:
+        return {}, None
+
+def _atomic_write(path, write):
+    """Call write(tmp_path) on a temp file beside `path`, then move it into place in one os.replace."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+def _save_cache(folder_path, manifest, raw):
+    stored = {"key": CACHE_KEY, "rows": sorted(raw.index), "files": manifest}
+    def write_manifest(tmp_path):
+        with open(tmp_path, "w") as f:
+            json.dump(stored, f)
+    try:
+        # Parquet first, manifest last: a reader never sees a manifest pointing at rows not yet written
+        _atomic_write(os.path.join(folder_path, CACHE_FILE), raw.to_parquet)
+        _atomic_write(os.path.join(folder_path, MANIFEST_FILE), write_manifest)
+    except Exception:
+        pass # Read-only folder or no parquet engine: the cache is an optimisation only
+
+def _extract_all(file_args):
+    """Run process_one_pdf over `file_args`, across cores when there's more than one file, otherwise in this process."""
+    # Each report is parsed independently, so fan the CPU-bound extraction out across cores.
+    # Spawn, never fork: forking the multi-threaded Streamlit server can deadlock a child on an inherited lock.
+    # Workers import `extraction` for the task; the app itself only runs under the __main__ guard at the bottom
+    n_workers = min(len(file_args), os.cpu_count() or 1)
+    if n_workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=multiprocessing.get_context("spawn")) as ex:
+                return list(ex.map(process_one_pdf, file_args))
+        except Exception:
+            pass # Pool failed to start or a worker died (BrokenProcessPool): redo the extraction serially below
+    return [process_one_pdf(args) for args in file_args]
 
-# --- PAGE CONFIGURATION ---
-st.set_page_config(page_title="Greenwashing Detector AI", layout="wide", page_icon="🌿")
-
-# --- CUSTOM CSS ---
-st.markdown("""
-<style>
-    .stApp { background-color: #0E1117; color: white; }
-    .metric-card {
-        background-color: #262730;
-        padding: 20px;
-        border-radius: 10px;
-        border: 1px solid #444;
-        text-align: center;
-        margin-bottom: 20px;
-    }
-    .evidence-box {
-        background-color: #1E1E1E;
-        padding: 15px;
-        border-radius: 5px;
-        font-family: monospace;
-        font-size: 0.85em;
-        color: #00CC96;
-        border-left: 3px solid #00CC96;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# --- DATA EXTRACTION ENGINE ---
 @st.cache_data
 def process_pdfs(folder_path):
-    data = []
-    
     if not os.path.exists(folder_path):
         return pd.DataFrame()
 
-    files = [f for f in os.listdir(folder_path) if f.endswith('.pdf')]
-    
-    for filename in files:
-        # --- COMPANY NAME MAPPING (Formal Names) ---
-        name_map = {
-            "acc.pdf": "ACC Limited",
-            "adani green.pdf": "Adani Green Energy Ltd.",
-            "Adani power.pdf": "Adani Power Ltd.",
-            "ambuja.pdf": "Ambuja Cements Ltd.",
-            "BPCL.pdf": "Bharat Petroleum Corporation Ltd.",
-            "Hindalco.pdf": "Hindalco Industries Ltd.",
-            "HPCL.pdf": "Hindustan Petroleum Corp. Ltd.",
-            "IOCL.pdf": "Indian Oil Corporation Ltd.",
-            "Jindal Steel.pdf": "Jindal Steel & Power Ltd.",
-            "Jsw energy.pdf": "JSW Energy Ltd.",
-            "Jsw Steel.pdf": "JSW Steel Ltd.",
-            "Nacl.pdf": "National Aluminium Company Ltd.",
-            "Nhpc.pdf": "NHPC Limited",
-            "Nmdc.pdf": "NMDC Limited",
-            "NTPC.pdf": "NTPC Limited",
-            "oil india.pdf": "Oil India Limited",
-            "Ongc.pdf": "Oil and Natural Gas Corporation",
-            "Reliance.pdf": "Reliance Industries Ltd.",
-            "SAIL.pdf": "Steel Authority of India Ltd.",
-            "Shree cement.pdf": "Shree Cement Ltd.",
-            "Sjvn.pdf": "SJVN Limited",
-            "Tata power.pdf": "Tata Power Company Ltd.",
-            "Tata Steel.pdf": "Tata Steel Ltd.",
-            "Ultratech.pdf": "UltraTech Cement Ltd.",
-            "Vedanta.pdf": "Vedanta Limited"
+    # One directory pass; each DirEntry's stat feeds the manifest without a second stat per file
+    with os.scandir(folder_path) as it:
+        entries = [(e.name, e.path, e.stat()) for e in it if e.is_file() and e.name.lower().endswith('.pdf')]
+    files = [name for name, _, _ in entries]
+    paths = {name: path for name, path, _ in entries}
+    manifest = {name: [stat.st_mtime, stat.st_size] for name, _, stat in entries}
+
+    cached_manifest, cached = _load_cache(folder_path)
+    if cached is None:
+        cached_manifest = {}
+    stale = [f for f in files if cached_manifest.get(f) != manifest[f]]
+
+    rows = {}
+    if cached is not None:
+        # Reuse rows for unchanged files; files that failed to parse last time simply have no row
+        rows = {f: row.to_dict() for f, row in cached.iterrows() if f in manifest and f not in stale}
+
+    if stale:
+        file_args = [(paths[f], f) for f in stale]
+        for f, row in zip(stale, _extract_all(file_args)):
+            if row:
+                rows[f] = row
+
+    raw = pd.DataFrame.from_dict(rows, orient="index").reindex([f for f in files if f in rows])
+    if stale or cached_manifest.keys() != manifest.keys():
+        _save_cache(folder_path, manifest, raw)
+
+    if raw.empty:
+        return pd.DataFrame()
+    return _score(raw.reset_index(drop=True))
+
+@st.cache_resource
+def index_by_company(df):
+    # One row per company (first wins, matching the old .iloc[0]) so .loc is a hash lookup returning a Series.
+    # cache_resource hands back the same frame each rerun instead of unpickling a copy; callers only read it
+    return df.drop_duplicates('Company').set_index('Company', drop=False)
+
+@st.cache_resource
+def build_base_fig(df):
+    # Traces and styling only depend on the dataset; the per-selection annotation is added by the caller
+    # Plain NumPy arrays into a WebGL trace: skips px's DataFrame introspection and renders markers on the GPU
+    csr = df['CSR Spend (Cr)'].to_numpy(dtype=float)
+    csr_max = csr.max() or 1.0
+    fig = go.Figure(go.Scattergl(
+        x=df['Talk Score'].to_numpy(), y=df['Walk Score'].to_numpy(), mode='markers',
+        marker=dict(color=df['Risk Score'].to_numpy(), colorscale='RdYlGn_r', showscale=True,
+                    colorbar=dict(title="Risk Score"), size=np.clip(csr / csr_max * 40, 5, 40)),
+        text=df['Company'].to_numpy(),
+        hovertemplate='<b>%{text}</b><br>Talk Score=%{x}<br>Walk Score=%{y}<br>Risk Score=%{marker.color}<extra></extra>'))
+    fig.update_layout(title="Talk vs. Walk Matrix (Top Right is Ideal)", xaxis_title="Talk Score", yaxis_title="Walk Score",
+                      paper_bgcolor="#0E1117", plot_bgcolor="#1E1E1E", font={'color': "white"}, height=500)
+    return fig
+
+@st.cache_data
+def df_to_csv_bytes(df):
+    return df.to_csv(index=False).encode('utf-8')
+
+def main():
+    # --- PAGE CONFIGURATION ---
+    st.set_page_config(page_title="Greenwashing Detector AI", layout="wide", page_icon="🌿")
+
+    # --- CUSTOM CSS ---
+    st.markdown("""
+    <style>
+        .stApp { background-color: #0E1117; color: white; }
+        .metric-card {
+            background-color: #262730;
+            padding: 20px;
+            border-radius: 10px;
+            border: 1px solid #444;
+            text-align: center;
+            margin-bottom: 20px;
         }
-        
-        # Use formal name if available, otherwise fallback to filename
-        company_name = name_map.get(filename, filename.replace(".pdf", "").replace("_", " ").title())
-        path = os.path.join(folder_path, filename)
-        
-        full_text = ""
-        # Extraction Variables
-        csr_spend = 0.0
-        renewable_energy = 0.0
-        total_energy = 1.0 
-        ghg_emissions = 0.0
-        policy_count = 0
-        
-        # Evidence Snippets (For "Show Me" feature)
-        csr_snippet = "Not Found"
-        renew_snippet = "Not Found"
-        
-        try:
-            with pdfplumber.open(path) as pdf:
-                # Read first 5 pages for summary data to save time, or all if needed
-                for page in pdf.pages[:10]: 
-                    text = page.extract_text()
-                    full_text += text
-                    
-                    # Regex Extraction with snippet capturing
-                    if csr_spend == 0:
-                        csr_match = re.search(r"(Community Spending|CSR Expenditure).*?([\d,]+\.?\d*)", text, re.IGNORECASE)
-                        if csr_match: 
-                            csr_spend = float(csr_match.group(2).replace(',', ''))
-                            csr_snippet = csr_match.group(0) # Capture the text found
-
-                    if renewable_energy == 0:
-                        ren_match = re.search(r"(Renewable Energy Use|Renewable Energy).*?([\d,]+\.?\d*)", text, re.IGNORECASE)
-                        if ren_match: 
-                            renewable_energy = float(ren_match.group(2).replace(',', ''))
-                            renew_snippet = ren_match.group(0)
-
-                    if total_energy == 1.0:
-                        en_match = re.search(r"(Total Energy Consumption|Energy Consumption).*?([\d,]+\.?\d*)", text, re.IGNORECASE)
-                        if en_match: total_energy = float(en_match.group(2).replace(',', ''))
-
-                    if ghg_emissions == 0:
-                        ghg_match = re.search(r"(GHG Scope 1|Scope 1 Emissions).*?([\d,]+\.?\d*)", text, re.IGNORECASE)
-                        if ghg_match: ghg_emissions = float(ghg_match.group(2).replace(',', ''))
-
-            # Policy Counting
-            policies = ['Climate Change Policy', 'Biodiversity Policy', 'Water Policy', 'Human Rights Policy', 'Whistle Blower Policy']
-            for p in policies:
-                if re.search(rf"{p}.*?Yes", full_text, re.IGNORECASE | re.DOTALL):
-                    policy_count += 1
-            
-            # Scoring Logic
-            talk_score = (policy_count / len(policies)) * 100
-            
-            # Walk Score Logic (Simplified for Demo)
-            renew_mix = (renewable_energy / total_energy) * 100 if total_energy > 10 else 0
-            csr_score = min((csr_spend / 500) * 50, 50) # Cap at 50 points
-            walk_score = renew_mix + csr_score
-            if walk_score > 100: walk_score = 100
-            
-            risk_score = talk_score - walk_score
-            if risk_score < 0: risk_score = 0
-            
-            data.append({
-                "Company": company_name,
-                "Risk Score": round(risk_score, 1),
-                "Talk Score": round(talk_score, 1),
-                "Walk Score": round(walk_score, 1),
-                "CSR Spend (Cr)": csr_spend,
-                "Renewable Energy": renewable_energy,
-                "Total Energy": total_energy,
-                "GHG Scope 1": ghg_emissions,
-                "Policies": policy_count,
-                "CSR Evidence": csr_snippet,
-                "Renewable Evidence": renew_snippet
-            })
-            
-        except Exception:
-            continue
+        .evidence-box {
+            background-color: #1E1E1E;
+            padding: 15px;
+            border-radius: 5px;
+            font-family: monospace;
+            font-size: 0.85em;
+            color: #00CC96;
+            border-left: 3px solid #00CC96;
+        }
+    </style>
+    """, unsafe_allow_html=True)
 
-    return pd.DataFrame(data)
+    # --- LOAD DATA ---
+    df = process_pdfs('.')
 
-# --- LOAD DATA ---
-df = process_pdfs('.')
+    # --- MAIN LAYOUT ---
+    st.title("🌿 AI-Based Greenwashing Detection System")
+    st.markdown("### Financial Statement Analysis & Forensic Auditing Project")
+    st.write("This tool utilizes NLP to audit ESG reports, detecting discrepancies between qualitative claims ('Talk') and quantitative spending ('Walk').")
 
-# --- MAIN LAYOUT ---
-st.title("🌿 AI-Based Greenwashing Detection System")
-st.markdown("### Financial Statement Analysis & Forensic Auditing Project")
-st.write("This tool utilizes NLP to audit ESG reports, detecting discrepancies between qualitative claims ('Talk') and quantitative spending ('Walk').")
+    if not df.empty:
+        df_indexed = index_by_company(df)
+        company_options = df_indexed.index
 
-if not df.empty:
-    # TABS FOR ORGANIZED VIEW
-    tab1, tab2, tab3 = st.tabs(["📊 Audit Dashboard", "📂 Raw Data & Downloads", "📘 Methodology"])
+        # TABS FOR ORGANIZED VIEW
+        tab1, tab2, tab3 = st.tabs(["📊 Audit Dashboard", "📂 Raw Data & Downloads", "📘 Methodology"])
 
-    with tab1:
-        st.divider()
-        col_search, col_space = st.columns([1, 2])
-        with col_search:
-            selected_company = st.selectbox("🔎 Select Company to Audit:", df['Company'].unique())
+        with tab1:
+            st.divider()
+            col_search, col_space = st.columns([1, 2])
+            with col_search:
+                selected_company = st.selectbox("🔎 Select Company to Audit:", company_options)
         
-        comp_data = df[df['Company'] == selected_company].iloc[0]
-
-        # --- SCORECARDS ---
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            st.markdown(f"<div class='metric-card'><h3>Greenwashing Risk</h3><h1 style='color:#FF4B4B'>{comp_data['Risk Score']}</h1><p>0 = Low Risk | 100 = High Risk</p></div>", unsafe_allow_html=True)
-        with c2:
-            st.markdown(f"<div class='metric-card'><h3>The 'Talk' Score</h3><h1 style='color:#4B90FF'>{comp_data['Talk Score']}</h1><p>Based on Policy Declarations</p></div>", unsafe_allow_html=True)
-        with c3:
-            st.markdown(f"<div class='metric-card'><h3>The 'Walk' Score</h3><h1 style='color:#00CC96'>{comp_data['Walk Score']}</h1><p>Based on Financial Spending</p></div>", unsafe_allow_html=True)
-
-        # --- DEEP DIVE ---
-        st.subheader(f"📝 Forensic Evidence for {selected_company}")
+            comp_data = df_indexed.loc[selected_company]
+
+            # --- SCORECARDS ---
+            c1, c2, c3 = st.columns(3)
+            with c1:
+                st.markdown(f"<div class='metric-card'><h3>Greenwashing Risk</h3><h1 style='color:#FF4B4B'>{comp_data['Risk Score']}</h1><p>0 = Low Risk | 100 = High Risk</p></div>", unsafe_allow_html=True)
+            with c2:
+                st.markdown(f"<div class='metric-card'><h3>The 'Talk' Score</h3><h1 style='color:#4B90FF'>{comp_data['Talk Score']}</h1><p>Based on Policy Declarations</p></div>", unsafe_allow_html=True)
+            with c3:
+                st.markdown(f"<div class='metric-card'><h3>The 'Walk' Score</h3><h1 style='color:#00CC96'>{comp_data['Walk Score']}</h1><p>Based on Financial Spending</p></div>", unsafe_allow_html=True)
+
+            # --- DEEP DIVE ---
+            st.subheader(f"📝 Forensic Evidence for {selected_company}")
         
-        col_ev1, col_ev2 = st.columns(2)
-        with col_ev1:
-            st.info("🗣 **Qualitative Analysis (Policies)**")
-            st.write(f"Policies Enacted: **{int(comp_data['Policies'])} / 5**")
-            st.progress(int(comp_data['Talk Score']))
-            st.caption("AI scan of: Climate, Biodiversity, Water, Human Rights, Whistleblower policies.")
-
-        with col_ev2:
-            st.warning("🏃 **Quantitative Analysis (Financials)**")
+            col_ev1, col_ev2 = st.columns(2)
+            with col_ev1:
+                st.info("🗣 **Qualitative Analysis (Policies)**")
+                st.write(f"Policies Enacted: **{int(comp_data['Policies'])} / 5**")
+                st.progress(int(comp_data['Talk Score']))
+                st.caption("AI scan of: Climate, Biodiversity, Water, Human Rights, Whistleblower policies.")
+
+            with col_ev2:
+                st.warning("🏃 **Quantitative Analysis (Financials)**")
             
-            st.write(f"💰 **CSR Spending:** ₹{comp_data['CSR Spend (Cr)']} Cr")
-            with st.expander("View Source Text"):
-                st.markdown(f"<div class='evidence-box'>{comp_data['CSR Evidence']}</div>", unsafe_allow_html=True)
+                st.write(f"💰 **CSR Spending:** ₹{comp_data['CSR Spend (Cr)']} Cr")
+                with st.expander("View Source Text"):
+                    st.markdown(f"<div class='evidence-box'>{comp_data['CSR Evidence']}</div>", unsafe_allow_html=True)
             
-            st.write(f"⚡ **Renewable Energy:** {comp_data['Renewable Energy']} units")
-            with st.expander("View Source Text"):
-                st.markdown(f"<div class='evidence-box'>{comp_data['Renewable Evidence']}</div>", unsafe_allow_html=True)
-
-        # --- SCATTER PLOT ---
-        st.divider()
-        st.subheader("📍 Comparative Analysis: Industry Landscape")
-        fig = px.scatter(df, x="Talk Score", y="Walk Score", color="Risk Score", 
-                         size="CSR Spend (Cr)", hover_name="Company",
-                         color_continuous_scale="RdYlGn_r", title="Talk vs. Walk Matrix (Top Right is Ideal)")
-        fig.add_annotation(x=comp_data['Talk Score'], y=comp_data['Walk Score'], text=selected_company, showarrow=True, arrowhead=1)
-        fig.update_layout(paper_bgcolor="#0E1117", plot_bgcolor="#1E1E1E", font={'color': "white"}, height=500)
-        st.plotly_chart(fig, use_container_width=True)
-
-    with tab2:
-        st.subheader("📂 Full Dataset")
-        st.dataframe(df)
+                st.write(f"⚡ **Renewable Energy:** {comp_data['Renewable Energy']} units")
+                with st.expander("View Source Text"):
+                    st.markdown(f"<div class='evidence-box'>{comp_data['Renewable Evidence']}</div>", unsafe_allow_html=True)
+
+            # --- SCATTER PLOT ---
+            st.divider()
+            st.subheader("📍 Comparative Analysis: Industry Landscape")
+            # Copy the shared cached figure so the annotation never leaks into other sessions
+            fig = go.Figure(build_base_fig(df))
+            fig.add_annotation(x=comp_data['Talk Score'], y=comp_data['Walk Score'], text=selected_company, showarrow=True, arrowhead=1)
+            st.plotly_chart(fig, use_container_width=True)
+
+        with tab2:
+            st.subheader("📂 Full Dataset")
+            st.dataframe(df)
         
-        # Download Button
-        csv = df.to_csv(index=False).encode('utf-8')
-        st.download_button(
-            label="📥 Download Audit Report (CSV)",
-            data=csv,
-            file_name='greenwashing_audit_report.csv',
-            mime='text/csv',
-        )
+            # Download Button
+            csv = df_to_csv_bytes(df)
+            st.download_button(
+                label="📥 Download Audit Report (CSV)",
+                data=csv,
+                file_name='greenwashing_audit_report.csv',
+                mime='text/csv',
+            )
 
-    with tab3:
-        st.markdown("""
-        ### Project Methodology
-        **1. Variable of Interest:**
-        - We extracted **Community Spending (CSR)** and **Renewable Energy Use** from Annual Reports.
+        with tab3:
+            st.markdown("""
+            ### Project Methodology
+            **1. Variable of Interest:**
+            - We extracted **Community Spending (CSR)** and **Renewable Energy Use** from Annual Reports.
         
-        **2. The 'Talk' Score (NLP):**
-        - Calculated by scanning policy disclosure tables for affirmations ('Yes') on Climate, Biodiversity, and Human Rights policies.
+            **2. The 'Talk' Score (NLP):**
+            - Calculated by scanning policy disclosure tables for affirmations ('Yes') on Climate, Biodiversity, and Human Rights policies.
         
-        **3. The 'Walk' Score (Financials):**
-        - Calculated using a weighted average of CSR intensity and Renewable Energy mix.
+            **3. The 'Walk' Score (Financials):**
+            - Calculated using a weighted average of CSR intensity and Renewable Energy mix.
         
-        **4. Greenwashing Detection:**
-        - Defined as the divergence between the Talk Score and the Walk Score. High divergence = High Risk.
-        """)
+            **4. Greenwashing Detection:**
+            - Defined as the divergence between the Talk Score and the Walk Score. High divergence = High Risk.
+            """)
+
+    else:
 
-else:
+        st.warning("⚠️ No data found. Please ensure the 'esg_reports' folder exists and contains PDFs.")
 
-    st.warning("⚠️ No data found. Please ensure the 'esg_reports' folder exists and contains PDFs.")
+# Streamlit runs this script as __main__; spawned extraction workers re-import it as __mp_main__ and must not re-run the app
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+# --- PDF TEXT EXTRACTION & FIELD/POLICY MATCHING ---
+# Kept free of Streamlit so process_one_pdf can be pickled to spawned workers; the dashboard lives in app.py
+import os
+import re
+import mmap
+from functools import lru_cache
+import pdfplumber
+import pypdfium2 as pdfium
+
+# Accelerators. Each has a pure-Python fallback that gives the same results, so a missing one only costs speed.
+# Optional: Hyperscan matches every policy pattern in a single pass over the text. Not in requirements.txt:
+# it needs the native Hyperscan library and x86 SIMD, so it won't install everywhere
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Aho-Corasick locates every numeric-field anchor phrase in a single pass over the text. Listed in
+# requirements.txt; the import is guarded only so the regex path still runs where the C extension can't build
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# --- EXTRACTION PATTERNS (compiled once) ---
+# Anchor phrases for each numeric field; the value is the first number after the anchor on the same line
+FIELD_ANCHORS = {
+    "csr": ("Community Spending", "CSR Expenditure"),
+    "renewable": ("Renewable Energy Use", "Renewable Energy"),
+    "energy": ("Total Energy Consumption", "Energy Consumption"),
+    "ghg": ("GHG Scope 1", "Scope 1 Emissions"),
+}
+# One bit per numeric field, for the per-document "still missing" mask
+FIELD_BITS = {field: 1 << i for i, field in enumerate(FIELD_ANCHORS)}
+ALL_FIELDS = (1 << len(FIELD_BITS)) - 1
+# Anchor-only fallback for when pyahocorasick is unavailable; the number is read by _parse_number on both paths.
+# Lowercase patterns without re.IGNORECASE: matched against text lowercased once per page
+FIELD_RES = {
+    field: re.compile("|".join(re.escape(a.lower()) for a in anchors))
+    for field, anchors in FIELD_ANCHORS.items()
+}
+DIGITS = "0123456789"
+
+def _parse_number(text, pos):
+    r"""Hand-rolled `[\d,]+\.?\d*` scan for the first number after `pos` on the same line; (value, end) or None."""
+    n = len(text)
+    i = pos
+    while i < n and text[i] not in DIGITS:
+        if text[i] == "\n":
+            return None
+        i += 1
+    if i == n:
+        return None
+    j = i
+    while j < n and (text[j] in DIGITS or text[j] == ","):
+        j += 1
+    if j < n and text[j] == ".":
+        j += 1
+        while j < n and text[j] in DIGITS:
+            j += 1
+    return float(text[i:j].replace(',', '')), j
+
+# Built lazily on the first page scanned, like _policy_db, so importing this module does no matcher setup
+@lru_cache(maxsize=None)
+def _field_automaton():
+    """Aho-Corasick automaton over all lowercased anchors (None if pyahocorasick is unavailable)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for field, anchors in FIELD_ANCHORS.items():
+        for anchor in anchors:
+            automaton.add_word(anchor.lower(), (field, len(anchor)))
+    automaton.make_automaton()
+    return automaton
+
+def _field_hits(text, lower_text, need):
+    """Return {field: (value, snippet)} for the first match of each field whose FIELD_BITS bit is set in `need`; `lower_text` is `text.lower()`."""
+    hits = {}
+    n_wanted = bin(need).count("1")
+    # Offsets from the lowercased text are only valid when lowercasing kept the length unchanged
+    same_len = len(lower_text) == len(text)
+    automaton = _field_automaton()
+    if automaton is not None and same_len:
+        for end, (field, anchor_len) in automaton.iter(lower_text):
+            if field in hits or not need & FIELD_BITS[field]:
+                continue
+            number = _parse_number(text, end + 1)
+            if number:
+                value, num_end = number
+                start = end + 1 - anchor_len
+                hits[field] = (value, text[start:num_end])
+                if len(hits) == n_wanted:
+                    break
+        return hits
+    for field, regex in FIELD_RES.items():
+        if not need & FIELD_BITS[field]:
+            continue
+        # Slice the original text so the evidence snippet keeps its casing
+        source = text if same_len else lower_text
+        for match in regex.finditer(lower_text):
+            number = _parse_number(source, match.end())
+            if number:
+                value, num_end = number
+                hits[field] = (value, source[match.start():num_end])
+                break
+    return hits
+
+POLICIES = ['Climate Change Policy', 'Biodiversity Policy', 'Water Policy', 'Human Rights Policy', 'Whistle Blower Policy']
+POLICY_WINDOW = 200 # chars after a policy name in which to look for the 'Yes' affirmation
+
+def _policy_hit(lower_text, policy):
+    """Literal scan: True if any mention of `policy` is followed by 'yes' within POLICY_WINDOW chars."""
+    needle = policy.lower()
+    i = lower_text.find(needle)
+    while i >= 0:
+        start = i + len(needle)
+        if "yes" in lower_text[start:start + POLICY_WINDOW]:
+            return True
+        i = lower_text.find(needle, start)
+    return False
+
+# Built lazily on the first scan and then kept for the life of the process. Compiling takes about a second,
+# so it must not run at import time, nor on reruns that hit process_pdfs' cache and never scan anything
+@lru_cache(maxsize=None)
+def _policy_db():
+    """Compile all policy patterns into one Hyperscan database (None if Hyperscan is unavailable)."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        # Same window as _policy_hit: 'yes' must end within POLICY_WINDOW characters (UTF8 flag: chars, not bytes)
+        expressions=[rf"{re.escape(p.lower())}.{{0,{POLICY_WINDOW - len('yes')}}}yes".encode() for p in POLICIES],
+        ids=list(range(len(POLICIES))),
+        elements=len(POLICIES),
+        flags=[hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8] * len(POLICIES), # scanned text is already lowercase
+    )
+    return db
+
+def _matched_policies(lower_text):
+    """Return the indices (into POLICIES) of every policy affirmed in the lowercased `lower_text`."""
+    policy_db = _policy_db()
+    if policy_db is not None:
+        found = set()
+        def on_match(policy_id, start, end, flags, context):
+            found.add(policy_id)
+        # 'replace' keeps the input valid UTF-8 (one '?' per lone surrogate), as HS_FLAG_UTF8 requires
+        policy_db.scan(lower_text.encode('utf-8', 'replace'), match_event_handler=on_match)
+        return found
+    return {idx for idx, p in enumerate(POLICIES) if _policy_hit(lower_text, p)}
+
+# --- COMPANY NAME MAPPING (Formal Names) ---
+NAME_MAP = {
+    "acc.pdf": "ACC Limited",
+    "adani green.pdf": "Adani Green Energy Ltd.",
+    "Adani power.pdf": "Adani Power Ltd.",
+    "ambuja.pdf": "Ambuja Cements Ltd.",
+    "BPCL.pdf": "Bharat Petroleum Corporation Ltd.",
+    "Hindalco.pdf": "Hindalco Industries Ltd.",
+    "HPCL.pdf": "Hindustan Petroleum Corp. Ltd.",
+    "IOCL.pdf": "Indian Oil Corporation Ltd.",
+    "Jindal Steel.pdf": "Jindal Steel & Power Ltd.",
+    "Jsw energy.pdf": "JSW Energy Ltd.",
+    "Jsw Steel.pdf": "JSW Steel Ltd.",
+    "Nacl.pdf": "National Aluminium Company Ltd.",
+    "Nhpc.pdf": "NHPC Limited",
+    "Nmdc.pdf": "NMDC Limited",
+    "NTPC.pdf": "NTPC Limited",
+    "oil india.pdf": "Oil India Limited",
+    "Ongc.pdf": "Oil and Natural Gas Corporation",
+    "Reliance.pdf": "Reliance Industries Ltd.",
+    "SAIL.pdf": "Steel Authority of India Ltd.",
+    "Shree cement.pdf": "Shree Cement Ltd.",
+    "Sjvn.pdf": "SJVN Limited",
+    "Tata power.pdf": "Tata Power Company Ltd.",
+    "Tata Steel.pdf": "Tata Steel Ltd.",
+    "Ultratech.pdf": "UltraTech Cement Ltd.",
+    "Vedanta.pdf": "Vedanta Limited"
+}
+
+# --- DATA EXTRACTION ENGINE ---
+PAGE_LIMIT = 10
+
+def _page_texts(path, max_pages=PAGE_LIMIT):
+    """Yield the text of the first `max_pages` pages, via pdfium; falls back to pdfplumber if pdfium can't open the file."""
+    try:
+        pdf = pdfium.PdfDocument(path)
+    except Exception:
+        # Memory-map the file so pdfminer pages through it instead of holding large reports in RAM.
+        # Only load the first `max_pages` pages, and no laparams: pdfminer's layout analysis isn't needed for extract_text
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                pdfplumber.open(mm, pages=list(range(1, max_pages + 1))) as pdf:
+            for page in pdf.pages:
+                # Scanned-image-only page: no chars, so skip the text clustering pass
+                yield (page.extract_text() or "") if page.chars else "" # extract_text is None for image-only pages
+                page.close() # Drop the page's parsed char/line/rect objects
+        return
+    try:
+        # pdfium reads the file lazily from disk itself, so it needs no mmap
+        for i in range(min(max_pages, len(pdf))):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            # Scanned-image-only page: no text chars, so skip building the text range
+            yield textpage.get_text_range() if textpage.count_chars() else ""
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+
+def process_one_pdf(path_and_name):
+    """Extract the raw metrics from a single report; returns a row dict, or None if unreadable."""
+    path, filename = path_and_name
+    
+    # Use formal name if available, otherwise fallback to filename
+    company_name = NAME_MAP.get(filename, os.path.splitext(filename)[0].replace("_", " ").title())
+    
+    # Extraction Variables
+    csr_spend = 0.0
+    renewable_energy = 0.0
+    total_energy = 1.0 
+    ghg_emissions = 0.0
+    policy_count = 0
+    found_policies = set()
+    need = ALL_FIELDS # bits of the numeric fields not yet found
+    
+    # Evidence Snippets (For "Show Me" feature)
+    csr_snippet = "Not Found"
+    renew_snippet = "Not Found"
+    
+    try:
+        # Read the first PAGE_LIMIT pages for summary data to save time
+        for text in _page_texts(path):
+            # Skip image-only / blank pages instead of letting them abort the whole document
+            if not text:
+                continue
+            lower_text = text.lower() # Case-fold once; every matcher below runs on this copy
+
+            # Numeric Extraction with snippet capturing, gated by one check on the missing-fields mask.
+            # A bit is cleared only once its field holds a real value (a matched 0 keeps looking, as before)
+            if need:
+                hits = _field_hits(text, lower_text, need)
+                if "csr" in hits:
+                    csr_spend, csr_snippet = hits["csr"] # Capture the text found
+                    if csr_spend: need &= ~FIELD_BITS["csr"]
+                if "renewable" in hits:
+                    renewable_energy, renew_snippet = hits["renewable"]
+                    if renewable_energy: need &= ~FIELD_BITS["renewable"]
+                if "energy" in hits:
+                    total_energy = hits["energy"][0]
+                    if total_energy != 1.0: need &= ~FIELD_BITS["energy"]
+                if "ghg" in hits:
+                    ghg_emissions = hits["ghg"][0]
+                    if ghg_emissions: need &= ~FIELD_BITS["ghg"]
+
+            # Policy scan runs on each page as it's extracted; the page text is then discarded
+            if len(found_policies) < len(POLICIES):
+                found_policies |= _matched_policies(lower_text)
+
+            # Early exit: stop extracting pages once every metric and policy has been found
+            if not need and len(found_policies) == len(POLICIES):
+                break
+
+        # Policy Counting (accumulated page by page above)
+        policy_count = len(found_policies)
+        
+        # Raw fields only; scores are computed for all companies at once in app._score
+        return {
+            "Company": company_name,
+            "CSR Spend (Cr)": csr_spend,
+            "Renewable Energy": renewable_energy,
+            "Total Energy": total_energy,
+            "GHG Scope 1": ghg_emissions,
+            "Policies": policy_count,
+            "CSR Evidence": csr_snippet,
+            "Renewable Evidence": renew_snippet
+        }
+        
+    except Exception:
+        return None